@@ -20,7 +20,10 @@ Run:
 """
 
 from __future__ import annotations
-import traceback
+import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from data_fetchers import (
@@ -31,106 +34,147 @@ from data_fetchers import (
     fetch_noaa_ncei_ohc_latest,
     fetch_forest_fires_data
 )
+import html_builder
+import utils
 from html_builder import build_html
+from utils import write_precompressed
 
+log = logging.getLogger("climate-dashboard")
 
-def main():
+# Digest of the inputs behind the last written index.html
+MANIFEST_PATH = Path("dist") / ".build_manifest.json"
+
+
+# Context key -> (fetcher, placeholder used when the fetcher raises)
+TASKS = {
+    "co2": (fetch_noaa_co2_monthly, {
+        "year": "N/A", "month": 0, "ppm": float("nan"), 
+        "chart": "", "source": "https://gml.noaa.gov/ccgg/trends/"
+    }),
+    "warnings": (fetch_met_eireann_warnings, {
+        "count": "N/A", "titles": [], 
+        "source": "https://www.met.ie/warnings"
+    }),
+    "dublin": (fetch_psmsl_dublin_note, {
+        "link": "https://psmsl.org/data/obtaining/stations/432.php",
+        "note": "Dublin tide-gauge shows a gradual long-term rise."
+    }),
+    "nsidc": (fetch_nsidc_arctic_daily, {
+        "latest": {"date": "N/A", "extent_mkm2": float("nan")}, 
+        "chart": "", "source": "https://nsidc.org/sea-ice-today"
+    }),
+    "ohc": (fetch_noaa_ncei_ohc_latest, {
+        "year": "N/A", "value": "N/A", "units": "", 
+        "source": "https://www.ncei.noaa.gov/access/global-ocean-heat-content/"
+    }),
+    "fires": (fetch_forest_fires_data, {
+        "count": "N/A", 
+        "source": "https://firms.modaps.eosdis.nasa.gov/",
+        "description": "Fire data temporarily unavailable"
+    }),
+}
+
+# One-line progress summaries printed as each fetcher finishes
+SUMMARIES = {
+    "co2": lambda d: f"CO₂: {d['ppm']} ppm ({d['year']}-{d['month']:02d})",
+    "warnings": lambda d: f"Warnings: {d['count']} active",
+    "dublin": lambda d: "Dublin tide gauge data available",
+    "nsidc": lambda d: f"Arctic ice: {d['latest']['extent_mkm2']} million km²",
+    "ohc": lambda d: f"Ocean heat: {d['value']} {d['units']} ({d['year']})",
+    "fires": lambda d: f"Forest fires: {d['count']} active fires detected",
+}
+
+
+def fetch_all() -> dict:
     """
-    Main function that orchestrates the dashboard generation.
+    Run every fetcher concurrently and collect their results.
     
-    Fetches all climate data from various sources, handles errors gracefully,
-    and generates the final HTML dashboard.
-    """
-    print("Fetching climate data...")
+    Every source lives on a different host, so the fetchers run in a
+    thread pool and the build waits for the slowest one rather than the
+    sum of all of them. A fetcher that raises is replaced by its
+    placeholder from TASKS.
     
-    # Fetch CO₂ data from NOAA
-    print("Fetching CO₂ data...")
-    try:
-        co2 = fetch_noaa_co2_monthly()
-        print(f"    CO₂: {co2['ppm']} ppm ({co2['year']}-{co2['month']:02d})")
-    except Exception as e:
-        print(f"    CO₂ data failed: {e}")
-        traceback.print_exc()
-        co2 = {
-            "year": "N/A", "month": 0, "ppm": float("nan"), 
-            "chart": "", "source": "https://gml.noaa.gov/ccgg/trends/"
-        }
+    Returns:
+        Context dictionary keyed like TASKS
+    """
+    # The fetchers import pandas/numpy lazily, and a first import racing
+    # across threads can fail half-initialised, so load them here first
+    import pandas  # noqa: F401
     
-    # Fetch weather warnings from Met Éireann
-    print("  Fetching weather warnings...")
-    try:
-        warnings = fetch_met_eireann_warnings()
-        print(f"    Warnings: {warnings['count']} active")
-    except Exception as e:
-        print(f"    Weather warnings failed: {e}")
-        traceback.print_exc()
-        warnings = {
-            "count": "N/A", "titles": [], 
-            "source": "https://www.met.ie/warnings"
-        }
+    context = {}
+    with ThreadPoolExecutor(max_workers=len(TASKS)) as executor:
+        futures = {executor.submit(fetch): name for name, (fetch, _) in TASKS.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                context[name] = future.result()
+                print(f"    {SUMMARIES[name](context[name])}")
+            except Exception as e:
+                print(f"    {name} data failed: {e}")
+                log.exception("%s fetcher failed", name)
+                context[name] = TASKS[name][1]
+    return context
+
+
+def build_digest(context: dict) -> str:
+    """
+    Hash everything the rendered page depends on.
     
-    # Get Dublin tide gauge info
-    print("  Getting Dublin tide gauge info...")
-    dublin = fetch_psmsl_dublin_note()
-    print("    Dublin tide gauge data available")
+    Covers the fetched data, the source of the modules that turn it into
+    HTML and the CSS/JS asset names, so a template change (or a minifier
+    appearing) also forces a rebuild.
     
-    # Fetch Arctic sea ice data from NSIDC
-    print("  Fetching Arctic sea ice data...")
-    try:
-        nsidc = fetch_nsidc_arctic_daily()
-        print(f"    Arctic ice: {nsidc['latest']['extent_mkm2']} million km²")
-    except Exception as e:
-        print(f"    Arctic sea ice data failed: {e}")
-        traceback.print_exc()
-        nsidc = {
-            "latest": {"date": "N/A", "extent_mkm2": float("nan")}, 
-            "chart": "", "source": "https://nsidc.org/sea-ice-today"
-        }
+    Args:
+        context: Fetched data keyed like TASKS
+        
+    Returns:
+        Hex digest of the page inputs
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+    for module in (html_builder, utils):
+        h.update(Path(module.__file__).read_bytes())
+    h.update(" ".join(html_builder.ASSETS).encode("utf-8"))
+    return h.hexdigest()
+
+
+def main():
+    """
+    Main function that orchestrates the dashboard generation.
     
-    # Fetch ocean heat content from NOAA NCEI
-    print("  Fetching ocean heat content...")
-    try:
-        ohc = fetch_noaa_ncei_ohc_latest()
-        print(f"    Ocean heat: {ohc['value']} {ohc['units']} ({ohc['year']})")
-    except Exception as e:
-        print(f"    Ocean heat content failed: {e}")
-        traceback.print_exc()
-        ohc = {
-            "year": "N/A", "value": "N/A", "units": "", 
-            "source": "https://www.ncei.noaa.gov/access/global-ocean-heat-content/"
-        }
+    Fetches all climate data from various sources in parallel, handles
+    errors gracefully, and generates the final HTML dashboard.
+    """
+    logging.basicConfig(level=logging.INFO)
+    print("Fetching climate data...")
+    context = fetch_all()
     
-    # Fetch forest fires data from NASA FIRMS
-    print("  Fetching forest fires data...")
+    # Skip the page build when nothing it depends on has changed
+    output_path = Path("dist") / "index.html"
+    digest = build_digest(context)
     try:
-        fires = fetch_forest_fires_data()
-        print(f"    Forest fires: {fires['count']} active fires detected")
-    except Exception as e:
-        print(f"    Forest fires data failed: {e}")
-        traceback.print_exc()
-        fires = {
-            "count": "N/A", 
-            "source": "https://firms.modaps.eosdis.nasa.gov/",
-            "description": "Fire data temporarily unavailable"
-        }
-    
-    # Build context dictionary
-    context = {
-        "co2": co2,
-        "warnings": warnings, 
-        "dublin": dublin,
-        "nsidc": nsidc,
-        "ohc": ohc,
-        "fires": fires
-    }
+        unchanged = output_path.exists() and json.loads(MANIFEST_PATH.read_text())["digest"] == digest
+    except (OSError, ValueError, KeyError):
+        unchanged = False
+    if unchanged:
+        print("No changes since the last build; keeping dist/index.html")
+        return
     
     # Generate HTML dashboard
     print("Building HTML dashboard...")
     html = build_html(context)
     
-    # Write to output file
-    output_path = Path("dist") / "index.html"
-    output_path.write_text(html, encoding="utf-8")
+    # Write the page and its hashed CSS/JS plus pre-compressed copies for
+    # hosts that serve them, dropping assets from earlier builds;
+    # .nojekyll stops GitHub Pages from running Jekyll over the output
+    write_precompressed(output_path, html.encode("utf-8"))
+    for name, body in html_builder.ASSETS.items():
+        write_precompressed(output_path.parent / name, body.encode("utf-8"))
+    for old in output_path.parent.glob("dash.*"):
+        if old.name.removesuffix(".gz").removesuffix(".br") not in html_builder.ASSETS:
+            old.unlink()
+    (output_path.parent / ".nojekyll").touch()
+    MANIFEST_PATH.write_text(json.dumps({"digest": digest}))
     print(f"Dashboard generated: {output_path}")
     print("Open dist/index.html in your browser to view the dashboard!")
 
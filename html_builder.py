@@ -7,8 +7,17 @@ structure, CSS styling, and JavaScript functionality.
 """
 
 from __future__ import annotations
+import hashlib
+from html import escape
+
 from utils import fmt_num, now_utc_str, m_to_inches
 
+try:
+    from rcssmin import cssmin
+    from rjsmin import jsmin
+except ImportError:  # optional accelerator, see requirements.txt
+    cssmin = jsmin = None
+
 
 # Sea level projections for 2050 (IPCC AR6-style)
 # Likely global mean sea-level rise by 2050 (relative to 1995–2014)
@@ -18,12 +27,104 @@ SEA_LEVEL_2050_INCH = {
     "high": (m_to_inches(0.20), m_to_inches(0.29)),  # keep same range for simplicity
 }
 
+# The same ranges formatted to one decimal, shared by the HTML and the JS
+_SLR_FMT = {k: (f"{lo:.1f}", f"{hi:.1f}") for k, (lo, hi) in SEA_LEVEL_2050_INCH.items()}
+
 SCENARIO_LABEL = {
     "low": "Low (SSP1-1.9)",
     "mid": "Middle (SSP2-4.5/5-8.5)", 
     "high": "High (SSP5-8.5)"
 }
 
+# Markup shared by every Simple tile
+TILE_TMPL = """
+      <div class="{cls}">
+        <div class="big">{big}</div>
+        <div class="title">{title}</div>
+        <p>{text}</p>
+        <details><summary>What this means</summary>
+          {meaning}
+        </details>
+      </div>
+"""
+
+# Markup shared by every Details card; "extra" holds an optional chart
+CARD_TMPL = """
+      <div class="card reveal">
+        <div class="label">{label}</div>
+        <div class="value">{value}</div>
+        <div class="sub">{sub}</div>
+        {extra}
+      </div>
+"""
+
+# Climate solutions: (title, blurb, [(link text, url), ...])
+SOLUTIONS = [
+    ("🌱 Carbon Nano Fiber Sheets",
+     "Ultra-thin carbon capture materials that can absorb CO₂ directly from air.",
+     [("Nature Paper", "https://www.nature.com/articles/s41586-019-1018-4"),
+      ("ACS Research", "https://pubs.acs.org/doi/10.1021/acs.chemmater.0c00001")]),
+    ("🔋 Advanced Battery Storage",
+     "Next-gen batteries enabling 100% renewable energy grids.",
+     [("Science Journal", "https://www.science.org/doi/10.1126/science.abc2757"),
+      ("Nature Energy", "https://www.nature.com/articles/s41560-020-00687-2")]),
+    ("🌊 Ocean Carbon Capture",
+     "Alkaline enhancement of ocean water to accelerate CO₂ absorption.",
+     [("Nature Study", "https://www.nature.com/articles/s41586-021-04341-1"),
+      ("ACS Research", "https://pubs.acs.org/doi/10.1021/acs.est.1c01205")]),
+    ("🌾 Regenerative Agriculture",
+     "Soil carbon sequestration through improved farming practices.",
+     [("Nature Research", "https://www.nature.com/articles/s41586-019-1552-6"),
+      ("Science Study", "https://www.science.org/doi/10.1126/science.abc2487")]),
+]
+
+SOLUTION_TMPL = """
+          <div class="solution-item">
+            <h4>{title}</h4>
+            <p>{text}</p>
+            <div class="solution-links">{links}
+            </div>
+          </div>
+"""
+
+LINK_TMPL = """
+              <a href="{url}" target="_blank">{name}</a>"""
+
+# Cities shown in the sea-level risk card; "risk" picks the badge colour
+CITIES = [
+    {"name": "Miami, Florida", "pop": "2.7M", "risk": "High", "year": 2050, "elevation": "2m"},
+    {"name": "Dhaka, Bangladesh", "pop": "21M", "risk": "Critical", "year": 2030, "elevation": "4m"},
+    {"name": "Amsterdam, Netherlands", "pop": "1.1M", "risk": "Medium", "year": 2060, "elevation": "2m (protected)"},
+    {"name": "Jakarta, Indonesia", "pop": "10.8M", "risk": "High", "year": 2040, "elevation": "8m"},
+]
+
+CITY_TMPL = """
+          <div class="city-item">
+            <h4>🏙️ {name}</h4>
+            <p>Population: {pop} | Risk: {risk} | Projected impact: {year}</p>
+            <div class="city-details">
+              <span class="risk-{risk_cls}">{risk} Risk</span>
+              <span class="elevation">Avg elevation: {elevation}</span>
+            </div>
+          </div>
+"""
+
+# Simple tiles with no live data, rendered once
+_TILE_SEA_LEVEL = TILE_TMPL.format_map({
+    "cls": "tile",
+    "big": "+3.6 inches",
+    "title": "Sea level since 1993",
+    "text": "Global seas have risen by ~9.2 cm — about a modern phone's thickness × 6.",
+    "meaning": "Higher baseline makes coastal flooding more frequent.",
+})
+_TILE_OCEAN_HEAT = TILE_TMPL.format_map({
+    "cls": "tile",
+    "big": "Oceans are the heat sponge",
+    "title": "Ocean heat content",
+    "text": "Most extra heat is stored in the upper 2 km of the ocean.",
+    "meaning": "Warmer oceans raise sea levels and power heavier downpours.",
+})
+
 
 def build_simple_tiles(ctx: dict) -> str:
     """
@@ -40,55 +141,33 @@ def build_simple_tiles(ctx: dict) -> str:
     fires = ctx["fires"]
     
     co2_ppm = fmt_num(co2.get("ppm"))
-    sea_level_phone_equiv = "about a modern phone's thickness × 6"  # ~3.6 inches
     nsidc_val = nsidc.get("latest", {}).get("extent_mkm2", float("nan"))
     
-    return f"""
-      <div class="tile pulse">
-        <div class="big"><span class="count" data-value="{co2_ppm}">0</span> ppm</div>
-        <div class="title">CO₂ in the air</div>
-        <p>Higher than at any point in human history.</p>
-        <details><summary>What this means</summary>
-          CO₂ traps heat. More CO₂ → warmer planet.
-        </details>
-      </div>
-
-      <div class="tile">
-        <div class="big">+3.6 inches</div>
-        <div class="title">Sea level since 1993</div>
-        <p>Global seas have risen by ~9.2 cm — {sea_level_phone_equiv}.</p>
-        <details><summary>What this means</summary>
-          Higher baseline makes coastal flooding more frequent.
-        </details>
-      </div>
-
-      <div class="tile">
-        <div class="big">{fmt_num(nsidc_val)} million km²</div>
-        <div class="title">Arctic summer ice</div>
-        <p>Trending lower; darker ocean absorbs more heat.</p>
-        <details><summary>What this means</summary>
-          Less ice → more warming feedback.
-        </details>
-      </div>
-
-      <div class="tile">
-        <div class="big">Oceans are the heat sponge</div>
-        <div class="title">Ocean heat content</div>
-        <p>Most extra heat is stored in the upper 2 km of the ocean.</p>
-        <details><summary>What this means</summary>
-          Warmer oceans raise sea levels and power heavier downpours.
-        </details>
-      </div>
-
-      <div class="tile">
-        <div class="big">{fmt_num(fires.get("count"), nd=0)} fires</div>
-        <div class="title">Active forest fires</div>
-        <p>Detected by NASA satellites in the last 24 hours.</p>
-        <details><summary>What this means</summary>
-          Forest fires release CO₂ and reduce carbon absorption capacity.
-        </details>
-      </div>
-    """
+    return "".join((
+        TILE_TMPL.format_map({
+            "cls": "tile pulse",
+            "big": f'<span class="count" data-value="{co2.get("ppm")}" data-animate="1">{co2_ppm}</span> ppm',
+            "title": "CO₂ in the air",
+            "text": "Higher than at any point in human history.",
+            "meaning": "CO₂ traps heat. More CO₂ → warmer planet.",
+        }),
+        _TILE_SEA_LEVEL,
+        TILE_TMPL.format_map({
+            "cls": "tile",
+            "big": f"{fmt_num(nsidc_val)} million km²",
+            "title": "Arctic summer ice",
+            "text": "Trending lower; darker ocean absorbs more heat.",
+            "meaning": "Less ice → more warming feedback.",
+        }),
+        _TILE_OCEAN_HEAT,
+        TILE_TMPL.format_map({
+            "cls": "tile",
+            "big": f'{fmt_num(fires.get("count"), nd=0)} fires',
+            "title": "Active forest fires",
+            "text": "Detected by NASA satellites in the last 24 hours.",
+            "meaning": "Forest fires release CO₂ and reduce carbon absorption capacity.",
+        }),
+    ))
 
 
 def build_details_tiles(ctx: dict) -> str:
@@ -103,50 +182,60 @@ def build_details_tiles(ctx: dict) -> str:
     """
     co2, warn, dublin, nsidc, ohc, fires = ctx["co2"], ctx["warnings"], ctx["dublin"], ctx["nsidc"], ctx["ohc"], ctx["fires"]
     
+    # Resolve every lookup up front so the cards below only read locals;
+    # free text from the feeds is escaped once here
     co2_ppm = fmt_num(co2.get("ppm"))
     co2_date = f'{co2.get("year", "N/A")}-{str(co2.get("month", "")).zfill(2)}'
-    nsidc_val = nsidc.get("latest", {}).get("extent_mkm2", float("nan"))
-    nsidc_date = nsidc.get("latest", {}).get("date", "N/A")
+    latest = nsidc.get("latest", {})
+    nsidc_val = latest.get("extent_mkm2", float("nan"))
+    nsidc_date = escape(str(latest.get("date", "N/A")))
+    nsidc_chart = nsidc.get("chart")
+    warn_titles = escape(", ".join(warn.get("titles") or []) or "—")
+    dublin_note = escape(dublin["note"])
+    ohc_value = escape(f'{ohc.get("value")} {ohc.get("units", "")}')
+    fires_count = fmt_num(fires.get("count"), nd=0)
+    fires_desc = escape(fires.get("description", ""))
     
-    return f"""
-      <div class="card reveal">
-        <div class="label">Atmospheric CO₂ (Mauna Loa, monthly)</div>
-        <div class="value">{co2_ppm} ppm</div>
-        <div class="sub">Latest: {co2_date} · <a href="{co2["source"]}">NOAA GML</a></div>
-        <img src="{co2.get("chart", "")}" alt="CO₂ last 24 months">
-      </div>
-
-      <div class="card reveal">
-        <div class="label">Met Éireann Warnings (Ireland)</div>
-        <div class="value">{fmt_num(warn.get("count"), nd=0)}</div>
-        <div class="sub">{", ".join(warn.get("titles") or []) or "—"} · <a href="{warn["source"]}">Source</a></div>
-      </div>
-
-      <div class="card reveal">
-        <div class="label">Arctic Sea Ice Extent</div>
-        <div class="value">{fmt_num(nsidc_val)} million km²</div>
-        <div class="sub">Latest: {nsidc_date} · <a href="{nsidc["source"]}">NSIDC</a></div>
-        {f'<img src="{nsidc.get("chart")}" alt="Arctic sea-ice extent sparkline">' if nsidc.get("chart") else "<div class='sub'>Chart unavailable this run.</div>"}
-      </div>
-
-      <div class="card reveal">
-        <div class="label">Dublin Tide Gauge</div>
-        <div class="value">{dublin["note"]}</div>
-        <div class="sub"><a href="{dublin["link"]}">PSMSL Station 432</a></div>
-      </div>
-
-      <div class="card reveal">
-        <div class="label">Ocean Heat Content (0–2000 m)</div>
-        <div class="value">{ohc.get("value")} {ohc.get("units", "")}</div>
-        <div class="sub">Latest year: {ohc.get("year", "N/A")} · <a href="{ohc["source"]}">NOAA NCEI</a></div>
-      </div>
-
-      <div class="card reveal">
-        <div class="label">Active Forest Fires (24h)</div>
-        <div class="value">{fmt_num(fires.get("count"), nd=0)} fires detected</div>
-        <div class="sub">{fires.get("description", "")} · <a href="{fires.get("source", "")}">NASA FIRMS</a></div>
-      </div>
-    """
+    cards = [
+        {
+            "label": "Atmospheric CO₂ (Mauna Loa, monthly)",
+            "value": f"{co2_ppm} ppm",
+            "sub": f'Latest: {co2_date} · <a href="{co2["source"]}">NOAA GML</a>',
+            "extra": f'<img src="{co2.get("chart", "")}" alt="CO₂ last 24 months">',
+        },
+        {
+            "label": "Met Éireann Warnings (Ireland)",
+            "value": fmt_num(warn.get("count"), nd=0),
+            "sub": f'{warn_titles} · <a href="{warn["source"]}">Source</a>',
+            "extra": "",
+        },
+        {
+            "label": "Arctic Sea Ice Extent",
+            "value": f"{fmt_num(nsidc_val)} million km²",
+            "sub": f'Latest: {nsidc_date} · <a href="{nsidc["source"]}">NSIDC</a>',
+            "extra": (f'<img src="{nsidc_chart}" alt="Arctic sea-ice extent sparkline">'
+                      if nsidc_chart else "<div class='sub'>Chart unavailable this run.</div>"),
+        },
+        {
+            "label": "Dublin Tide Gauge",
+            "value": dublin_note,
+            "sub": f'<a href="{dublin["link"]}">PSMSL Station 432</a>',
+            "extra": "",
+        },
+        {
+            "label": "Ocean Heat Content (0–2000 m)",
+            "value": ohc_value,
+            "sub": f'Latest year: {ohc.get("year", "N/A")} · <a href="{ohc["source"]}">NOAA NCEI</a>',
+            "extra": "",
+        },
+        {
+            "label": "Active Forest Fires (24h)",
+            "value": f"{fires_count} fires detected",
+            "sub": f'{fires_desc} · <a href="{fires.get("source", "")}">NASA FIRMS</a>',
+            "extra": "",
+        },
+    ]
+    return "".join(CARD_TMPL.format_map(card) for card in cards)
 
 
 def build_climate_solutions_section() -> str:
@@ -156,45 +245,17 @@ def build_climate_solutions_section() -> str:
     Returns:
         HTML string for climate solutions section
     """
-    return """
+    items = "".join(
+        SOLUTION_TMPL.format(
+            title=title, text=text,
+            links="".join(LINK_TMPL.format(url=url, name=name) for name, url in links),
+        )
+        for title, text, links in SOLUTIONS
+    )
+    return f"""
       <div class="solutions card reveal">
         <div class="label">Climate Solutions & Innovations</div>
-        <div class="solutions-grid">
-          <div class="solution-item">
-            <h4>🌱 Carbon Nano Fiber Sheets</h4>
-            <p>Ultra-thin carbon capture materials that can absorb CO₂ directly from air.</p>
-            <div class="solution-links">
-              <a href="https://www.nature.com/articles/s41586-019-1018-4" target="_blank">Nature Paper</a>
-              <a href="https://pubs.acs.org/doi/10.1021/acs.chemmater.0c00001" target="_blank">ACS Research</a>
-            </div>
-          </div>
-          
-          <div class="solution-item">
-            <h4>🔋 Advanced Battery Storage</h4>
-            <p>Next-gen batteries enabling 100% renewable energy grids.</p>
-            <div class="solution-links">
-              <a href="https://www.science.org/doi/10.1126/science.abc2757" target="_blank">Science Journal</a>
-              <a href="https://www.nature.com/articles/s41560-020-00687-2" target="_blank">Nature Energy</a>
-            </div>
-          </div>
-          
-          <div class="solution-item">
-            <h4>🌊 Ocean Carbon Capture</h4>
-            <p>Alkaline enhancement of ocean water to accelerate CO₂ absorption.</p>
-            <div class="solution-links">
-              <a href="https://www.nature.com/articles/s41586-021-04341-1" target="_blank">Nature Study</a>
-              <a href="https://pubs.acs.org/doi/10.1021/acs.est.1c01205" target="_blank">ACS Research</a>
-            </div>
-          </div>
-          
-          <div class="solution-item">
-            <h4>🌾 Regenerative Agriculture</h4>
-            <p>Soil carbon sequestration through improved farming practices.</p>
-            <div class="solution-links">
-              <a href="https://www.nature.com/articles/s41586-019-1552-6" target="_blank">Nature Research</a>
-              <a href="https://www.science.org/doi/10.1126/science.abc2487" target="_blank">Science Study</a>
-            </div>
-          </div>
+        <div class="solutions-grid">{items}
         </div>
       </div>
     """
@@ -207,45 +268,11 @@ def build_sea_level_cities_section() -> str:
     Returns:
         HTML string for sea level cities section
     """
-    return """
+    items = "".join(CITY_TMPL.format(risk_cls=city["risk"].lower(), **city) for city in CITIES)
+    return f"""
       <div class="cities card reveal">
         <div class="label">Major Cities at Risk from Sea Level Rise</div>
-        <div class="cities-grid">
-          <div class="city-item">
-            <h4>🏙️ Miami, Florida</h4>
-            <p>Population: 2.7M | Risk: High | Projected impact: 2050</p>
-            <div class="city-details">
-              <span class="risk-high">High Risk</span>
-              <span class="elevation">Avg elevation: 2m</span>
-            </div>
-          </div>
-          
-          <div class="city-item">
-            <h4>🏙️ Dhaka, Bangladesh</h4>
-            <p>Population: 21M | Risk: Critical | Projected impact: 2030</p>
-            <div class="city-details">
-              <span class="risk-critical">Critical Risk</span>
-              <span class="elevation">Avg elevation: 4m</span>
-            </div>
-          </div>
-          
-          <div class="city-item">
-            <h4>🏙️ Amsterdam, Netherlands</h4>
-            <p>Population: 1.1M | Risk: Medium | Projected impact: 2060</p>
-            <div class="city-details">
-              <span class="risk-medium">Medium Risk</span>
-              <span class="elevation">Avg elevation: 2m (protected)</span>
-            </div>
-          </div>
-          
-          <div class="city-item">
-            <h4>🏙️ Jakarta, Indonesia</h4>
-            <p>Population: 10.8M | Risk: High | Projected impact: 2040</p>
-            <div class="city-details">
-              <span class="risk-high">High Risk</span>
-              <span class="elevation">Avg elevation: 8m</span>
-            </div>
-          </div>
+        <div class="cities-grid">{items}
         </div>
         <div class="sub">Data from <a href="https://sealevel.nasa.gov/" target="_blank">NASA Sea Level Change</a> and <a href="https://coastal.climatecentral.org/" target="_blank">Climate Central</a></div>
       </div>
@@ -272,7 +299,7 @@ def build_projections_section() -> str:
             <label>Projection year: <input id="yr" type="range" min="2025" max="2050" value="2050"></label>
           </div>
         </div>
-        <div id="slr" class="value">By <b>2050</b>: <b>{fmt_num(SEA_LEVEL_2050_INCH["mid"][0], 1)}–{fmt_num(SEA_LEVEL_2050_INCH["mid"][1], 1)} inches</b> (Middle)</div>
+        <div id="slr" class="value">By <b>2050</b>: <b>{_SLR_FMT["mid"][0]}–{_SLR_FMT["mid"][1]} inches</b> (Middle)</div>
         <div class="sub">Ranges reflect IPCC "likely" bands relative to 1995–2014 baseline.</div>
       </div>
     """
@@ -590,28 +617,29 @@ def build_javascript() -> str:
     secs[btn.dataset.tab].classList.add('active');
   }}));
 
-  // Count-up animation
-  const ease = t => 1 - Math.pow(1-t, 3);
-  const counts = [...document.querySelectorAll('.count')];
-  const io1 = new IntersectionObserver(es => es.forEach(e=>{{
-    if (!e.isIntersecting) return;
-    const el = e.target; io1.unobserve(el);
-    const end = parseFloat(el.dataset.value); const start = 0, dur = 1000; let t0;
-    function tick(ts){{ t0 ??= ts; const p = Math.min(1,(ts-t0)/dur); el.textContent = (start+(end-start)*ease(p)).toFixed(end%1?1:0); if(p<1) requestAnimationFrame(tick); }}
+  // One observer drives both the count-up and reveal-on-scroll.
+  // Count-up: the final value is already in the markup, so this is
+  // decoration only: skipped on small screens and for reduced-motion users.
+  // Ease-out curve precomputed as a 30-step table.
+  const STEPS = Array.from({{length:30}}, (_,i) => 1 - Math.pow(1 - i/29, 3));
+  const countUp = matchMedia('(prefers-reduced-motion: no-preference)').matches && matchMedia('(min-width: 768px)').matches;
+  const io = new IntersectionObserver(es => es.forEach(e=>{{
+    const el = e.target;
+    if (!el.classList.contains('count')) {{ el.classList.toggle('show', e.isIntersecting); return; }}
+    if (e.intersectionRatio < .6) return;
+    io.unobserve(el);
+    const text = el.textContent, end = parseFloat(el.dataset.value), dur = 1000; let t0;
+    if (isNaN(end)) return;
+    function tick(ts){{ t0 ??= ts; const p = Math.min(1,(ts-t0)/dur); el.textContent = p<1 ? (end*STEPS[Math.floor(p*29)]).toFixed(end%1?1:0) : text; if(p<1) requestAnimationFrame(tick); }}
     requestAnimationFrame(tick);
-  }}), {{threshold:.6}});
-  counts.forEach(el=>io1.observe(el));
-
-  // Reveal-on-scroll animation
-  const rev = document.querySelectorAll('.reveal');
-  const io2 = new IntersectionObserver(es => es.forEach(e=> e.target.classList.toggle('show', e.isIntersecting)), {{threshold:.2}});
-  rev.forEach(el=>io2.observe(el));
+  }}), {{threshold:[.2,.6]}});
+  document.querySelectorAll(countUp ? '.reveal, .count[data-animate]' : '.reveal').forEach(el=>io.observe(el));
 
   // Sea level projections
   const SLR = {{
-    low:  [{SEA_LEVEL_2050_INCH["low"][0]:.1f}, {SEA_LEVEL_2050_INCH["low"][1]:.1f}],
-    mid:  [{SEA_LEVEL_2050_INCH["mid"][0]:.1f}, {SEA_LEVEL_2050_INCH["mid"][1]:.1f}],
-    high: [{SEA_LEVEL_2050_INCH["high"][0]:.1f}, {SEA_LEVEL_2050_INCH["high"][1]:.1f}],
+    low:  [{_SLR_FMT["low"][0]}, {_SLR_FMT["low"][1]}],
+    mid:  [{_SLR_FMT["mid"][0]}, {_SLR_FMT["mid"][1]}],
+    high: [{_SLR_FMT["high"][0]}, {_SLR_FMT["high"][1]}],
   }};
   const SCN_LABEL = {{ low:"Low", mid:"Middle", high:"High" }};
   let scenario = "mid";
@@ -804,29 +832,22 @@ def build_javascript() -> str:
   """
 
 
-def build_html(ctx: dict) -> str:
-    """
-    Build the complete HTML dashboard.
-    
-    Args:
-        ctx: Context dictionary containing all climate data
-        
-    Returns:
-        Complete HTML string for the dashboard
-    """
-    now = now_utc_str()
-    co2, warn, dublin, nsidc, ohc, fires = ctx["co2"], ctx["warnings"], ctx["dublin"], ctx["nsidc"], ctx["ohc"], ctx["fires"]
-    
-    # Build sections
-    simple_tiles = build_simple_tiles(ctx)
-    details_tiles = build_details_tiles(ctx)
-    projections = build_projections_section()
-    solutions = build_climate_solutions_section()
-    cities = build_sea_level_cities_section()
-    css = build_css()
-    javascript = build_javascript()
-    
-    return f"""<!DOCTYPE html>
+# Fragments that depend only on module constants, rendered once at import;
+# CSS and JS are minified when rcssmin/rjsmin are installed
+_CSS = build_css()
+_JS = build_javascript()
+if cssmin is not None:
+    _CSS, _JS = cssmin(_CSS), jsmin(_JS)
+_PROJECTIONS = build_projections_section()
+
+# CSS and JS ship as separate files named by content hash, so browsers keep
+# them cached across rebuilds; build.py writes them next to index.html
+CSS_ASSET = f"dash.{hashlib.blake2b(_CSS.encode('utf-8'), digest_size=8).hexdigest()}.css"
+JS_ASSET = f"dash.{hashlib.blake2b(_JS.encode('utf-8'), digest_size=8).hexdigest()}.js"
+ASSETS = {CSS_ASSET: _CSS, JS_ASSET: _JS}
+
+# Static page skeleton, split around the dynamic fragments build_html inserts
+HTML_HEAD = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -835,16 +856,19 @@ def build_html(ctx: dict) -> str:
 <!-- Google AdSense -->
 <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-4840490843724733"
      crossorigin="anonymous"></script>
-<style>
-{css}
-</style>
+<link rel="stylesheet" href="{CSS_ASSET}">
+"""
+
+HTML_HEADER = """
 </head>
 <body>
   <div class="header">
     <h1>Climate Change Board</h1>
     <div class="header-right">
       <button class="about-header-btn" onclick="showAboutPopup()">About Us</button>
-      <div class="sub">Generated: {now}</div>
+      <div class="sub">Generated: """
+
+HTML_SIMPLE_OPEN = """</div>
     </div>
   </div>
 
@@ -855,25 +879,34 @@ def build_html(ctx: dict) -> str:
 
   <section id="simple" class="section active">
     <div class="grid">
-      {simple_tiles}
+      """
+
+HTML_GRID_CLOSE = """
     </div>
-    {projections}
-    {solutions}
-    {cities}
+    """
+
+HTML_DETAILS_OPEN = """
   </section>
 
   <section id="details" class="section">
     <div class="grid">
-      {details_tiles}
-    </div>
-    {solutions}
-    {cities}
+      """
+
+# Solutions and cities show under both tabs, so they follow both sections once
+HTML_SHARED = f"""
   </section>
+{build_climate_solutions_section()}
+{build_sea_level_cities_section()}"""
 
+SOURCES_TMPL = """
   <div class="sub" style="margin-top:20px">
-    Sources: <a href="{co2["source"]}">NOAA GML</a>, <a href="{nsidc["source"]}">NSIDC</a>, <a href="{ohc["source"]}">NOAA NCEI</a>, <a href="{dublin["link"]}">PSMSL Dublin</a>, <a href="{warn["source"]}">Met Éireann</a>, <a href="{fires.get("source", "")}">NASA FIRMS</a>
+    Sources: <a href="{co2}">NOAA GML</a>, <a href="{nsidc}">NSIDC</a>, \
+<a href="{ohc}">NOAA NCEI</a>, <a href="{dublin}">PSMSL Dublin</a>, \
+<a href="{warnings}">Met Éireann</a>, <a href="{fires}">NASA FIRMS</a>
   </div>
+"""
 
+HTML_THEME_CONTROLS = f"""
 
 
   <!-- Theme Toggle Buttons -->
@@ -889,9 +922,35 @@ def build_html(ctx: dict) -> str:
     </button>
   </div>
 
-  <script>
-{javascript}
-  </script>
+  <script src="{JS_ASSET}"></script>
+"""
+
+HTML_TAIL = """
 </body>
 </html>
 """
+
+
+def build_html(ctx: dict) -> str:
+    """
+    Build the complete HTML dashboard.
+    
+    Args:
+        ctx: Context dictionary containing all climate data
+        
+    Returns:
+        Complete HTML string for the dashboard
+    """
+    co2, warn, dublin, nsidc, ohc, fires = ctx["co2"], ctx["warnings"], ctx["dublin"], ctx["nsidc"], ctx["ohc"], ctx["fires"]
+    sources = SOURCES_TMPL.format_map({
+        "co2": co2["source"], "nsidc": nsidc["source"], "ohc": ohc["source"],
+        "dublin": dublin["link"], "warnings": warn["source"], "fires": fires.get("source", ""),
+    })
+    
+    # Static fragments interleaved with the dynamic ones, joined once
+    return "".join([
+        HTML_HEAD, HTML_HEADER, now_utc_str(),
+        HTML_SIMPLE_OPEN, build_simple_tiles(ctx), HTML_GRID_CLOSE, _PROJECTIONS,
+        HTML_DETAILS_OPEN, build_details_tiles(ctx), HTML_GRID_CLOSE,
+        HTML_SHARED, sources, HTML_THEME_CONTROLS, HTML_TAIL,
+    ])
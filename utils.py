@@ -7,22 +7,181 @@ and other common operations used throughout the dashboard.
 """
 
 from __future__ import annotations
-import io
+import os
+import gzip
+import json
+import math
+import time
+import numbers
+import hashlib
+import functools
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
-import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, see requirements.txt
+    orjson = None
 
-def http_get(url: str, timeout: int = 30, allow_redirects: bool = True) -> requests.Response:
+try:
+    import brotli
+except ImportError:  # optional accelerator, see requirements.txt
+    brotli = None
+
+
+# Shared session: keeps TLS connections alive across fetchers and retries
+# transient gateway errors before a URL is treated as failed. Connect and
+# read errors are not retried: a hung mirror would otherwise cost several
+# full timeouts before the caller moves on to the next one.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "climate-dashboard/1.2 (+github actions)"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.5,
+                      status_forcelist=[500, 502, 503, 504]),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# Session for live_first's HEAD probes, with no retries at all: a probe is
+# there to find a dead mirror quickly, not to wait it out.
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.headers.update(SESSION.headers)
+_PROBE_ADAPTER = HTTPAdapter(max_retries=0)
+_PROBE_SESSION.mount("https://", _PROBE_ADAPTER)
+_PROBE_SESSION.mount("http://", _PROBE_ADAPTER)
+
+# Conditional-GET cache: one body file plus a JSON sidecar of validators per
+# URL. Dot-prefixed so the Pages deploy step (cp dist/*) never publishes it.
+HTTP_CACHE_DIR = Path("dist") / ".http_cache"
+
+# Negative cache: URLs that failed recently, mapped to the epoch time their
+# entry expires, so a re-run skips dead mirrors instead of waiting on them.
+URL_BLACKLIST_PATH = Path("dist") / ".url_blacklist.json"
+URL_BLACKLIST_TTL = 600
+_BLACKLIST_LOCK = threading.Lock()
+
+
+def cache_path(key: str, suffix: str) -> Path:
+    """
+    Get the file in the HTTP cache directory used for a given key.
+    
+    Args:
+        key: Cache key, usually the request URL
+        suffix: File suffix, e.g. ".body" or ".json"
+        
+    Returns:
+        Path inside HTTP_CACHE_DIR
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return HTTP_CACHE_DIR / f"{digest}{suffix}"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file via a temporary file and rename, so concurrent
+    readers never see a partially written file.
+    
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_precompressed(path: Path, data: bytes) -> None:
+    """
+    Write a published file plus pre-compressed .gz (and .br) copies.
+    
+    Static hosts that support it serve the compressed variant directly, so
+    the compression cost is paid once per build instead of per request.
+    The .br copy is only written when the optional brotli package is
+    installed.
+    
+    Args:
+        path: Destination file path
+        data: File contents
+    """
+    path.write_bytes(data)
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + ".br").write_bytes(brotli.compress(data, quality=11))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_blacklist() -> dict:
+    """
+    Load the negative cache once per process; later calls share the dict.
+    
+    Returns:
+        Mapping of URL to expiry epoch time
+    """
+    try:
+        return json.loads(URL_BLACKLIST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_blacklisted(url: str) -> bool:
+    """
+    Check whether a URL failed within the last URL_BLACKLIST_TTL seconds.
+    
+    Args:
+        url: The URL about to be fetched
+        
+    Returns:
+        True if the URL should be skipped
+    """
+    with _BLACKLIST_LOCK:
+        return time.time() < _load_blacklist().get(url, 0)
+
+
+def _blacklist_url(url: str) -> None:
+    """
+    Record a failed URL in the negative cache and persist it.
+    
+    Args:
+        url: The URL that failed
+    """
+    with _BLACKLIST_LOCK:
+        blacklist = _load_blacklist()
+        now = time.time()
+        for u in [u for u, expires in blacklist.items() if expires <= now]:
+            del blacklist[u]
+        blacklist[url] = now + URL_BLACKLIST_TTL
+        write_atomic(URL_BLACKLIST_PATH, json.dumps(blacklist).encode("utf-8"))
+
+
+def http_get(url: str, timeout: int = 30, allow_redirects: bool = True,
+             headers: dict | None = None) -> requests.Response:
     """
     Make an HTTP GET request with proper headers and error handling.
     
+    Responses carrying an ETag or Last-Modified header are stored in
+    HTTP_CACHE_DIR. Later calls send If-None-Match / If-Modified-Since and,
+    on 304 Not Modified, return the stored body with ``from_cache = True``.
+    Ranged requests are cached separately from full downloads.
+    
+    A URL that fails (connection error, timeout or error status) is skipped
+    without a request for URL_BLACKLIST_TTL seconds, so callers move
+    straight on to their next mirror.
+    
     Args:
         url: The URL to fetch
         timeout: Request timeout in seconds
         allow_redirects: Whether to follow redirects
+        headers: Extra request headers, e.g. a Range header
         
     Returns:
         Response object
@@ -30,9 +189,45 @@ def http_get(url: str, timeout: int = 30, allow_redirects: bool = True) -> reque
     Raises:
         requests.RequestException: If the request fails
     """
-    r = requests.get(url, timeout=timeout, allow_redirects=allow_redirects,
-        headers={"User-Agent": "climate-dashboard/1.2 (+github actions)"})
-    r.raise_for_status()
+    headers = dict(headers or {})
+    key = f"{url} {headers['Range']}" if "Range" in headers else url
+    meta_path, body_path = cache_path(key, ".json"), cache_path(key, ".body")
+    meta = None
+    if meta_path.exists() and body_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except ValueError:
+            meta = None
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    
+    if _is_blacklisted(url):
+        raise requests.ConnectionError(f"{url} failed recently, skipping")
+    
+    try:
+        r = SESSION.get(url, timeout=timeout, allow_redirects=allow_redirects, headers=headers)
+        if r.status_code == 304 and meta:
+            r._content = body_path.read_bytes()
+            r.status_code = meta.get("status", 200)
+            r.encoding = meta.get("encoding")
+            r.from_cache = True
+            return r
+        r.raise_for_status()
+    except requests.RequestException:
+        _blacklist_url(url)
+        raise
+    r.from_cache = False
+    
+    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+    if etag or last_modified:
+        write_atomic(body_path, r.content)
+        write_atomic(meta_path, json.dumps({
+            "url": url, "etag": etag, "last_modified": last_modified,
+            "encoding": r.encoding, "status": r.status_code,
+        }).encode("utf-8"))
     return r
 
 
@@ -40,6 +235,9 @@ def try_urls(urls: list[str], timeout: int = 45, binary: bool = False) -> tuple[
     """
     Try multiple URLs in sequence until one succeeds.
     
+    Transient 5xx responses are already retried by the session, so a URL
+    that raises here is genuinely unavailable and the next one is tried.
+    
     Args:
         urls: List of URLs to try
         timeout: Request timeout in seconds
@@ -62,6 +260,61 @@ def try_urls(urls: list[str], timeout: int = 45, binary: bool = False) -> tuple[
     raise last_err if last_err else RuntimeError("No URLs tried")
 
 
+def live_first(urls: list[str], timeout: int = 5) -> list[str]:
+    """
+    Reorder candidate URLs so the most preferred live one comes first.
+    
+    All candidates are probed with HEAD in parallel, but the answer is
+    returned as soon as the most preferred URL still in the running
+    responds: with a healthy first mirror that is one round trip, however
+    long the other probes take. Probes still running are abandoned rather
+    than waited on. A failed probe only demotes its URL: a mirror that is
+    merely slow to answer HEAD may still serve the GET, so negative caching
+    is left to http_get, and if no probe succeeds the original order is
+    returned unchanged.
+    
+    Args:
+        urls: Candidate URLs in order of preference
+        timeout: Probe timeout in seconds
+        
+    Returns:
+        The same URLs, with the first live one moved to the front
+    """
+    def probe(u: str) -> bool:
+        try:
+            return _PROBE_SESSION.head(u, timeout=timeout, allow_redirects=True).status_code == 200
+        except requests.RequestException:
+            return False
+    
+    candidates = [u for u in urls if not _is_blacklisted(u)]
+    if not candidates:
+        return list(urls)
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    futures = [executor.submit(probe, u) for u in candidates]
+    try:
+        for u, future in zip(candidates, futures):
+            if future.result():
+                return [u] + [x for x in urls if x != u]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return list(urls)
+
+
+def parse_json(body: bytes):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        body: Raw response bytes
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def now_utc_str() -> str:
     """
     Get current UTC time as a formatted string.
@@ -72,6 +325,30 @@ def now_utc_str() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
 
+def _fmt_none(val, nd: int, default: str) -> str:
+    """Format a missing value as the default placeholder."""
+    return default
+
+
+def _fmt_int(val, nd: int, default: str) -> str:
+    """Format an integer as-is, without decimal places."""
+    return f"{val}"
+
+
+def _fmt_float(val, nd: int, default: str) -> str:
+    """Format a float to nd decimal places, or the default if it is NaN."""
+    return default if math.isnan(val) else f"{val:.{nd}f}"
+
+
+# fmt_num formatters keyed on the exact value type; anything else
+# (strings, numpy scalars) falls back to a float() conversion.
+_FMT_DISPATCH = {
+    type(None): _fmt_none,
+    bool: _fmt_int, int: _fmt_int,
+    float: _fmt_float,
+}
+
+
 def fmt_num(val, nd: int = 2, default: str = "—") -> str:
     """
     Format a number with specified decimal places, handling None and NaN values.
@@ -85,11 +362,12 @@ def fmt_num(val, nd: int = 2, default: str = "—") -> str:
         Formatted number string
     """
     try:
-        if val is None or (isinstance(val, float) and np.isnan(val)):
-            return default
-        if isinstance(val, (int, np.integer)):
-            return f"{val}"
-        return f"{float(val):.{nd}f}"
+        fmt = _FMT_DISPATCH.get(type(val))
+        if fmt is not None:
+            return fmt(val, nd, default)
+        if isinstance(val, numbers.Integral):
+            return _fmt_int(val, nd, default)
+        return _fmt_float(float(val), nd, default)
     except Exception:
         return default
 